@@ -18,23 +18,13 @@ from .identities import (
     metallic_mean,
     golden_mean,
     verify_errante_identity,
+    verify_errante_identity_batch,
     exceptional_family,
+    exceptional_family_tuples,
+    FamilySoA,
     verify_quadratic_field_classification
 )
 
-from .asymptotic import (
-    asymptotic_expansion_phi_n,
-    asymptotic_expansion_ln_phi_n,
-    catalan_coefficients,
-    expansion_coefficients_b_k
-)
-
-from .cyclotomic import (
-    cyclotomic_identities,
-    verify_cyclotomic_identities,
-    pentagonal_geometry
-)
-
 __version__ = "1.0.0"
 __author__ = "Beatriz Errante"
 
@@ -44,8 +34,35 @@ __all__ = [
     'metallic_mean',
     'golden_mean',
     'verify_errante_identity',
+    'verify_errante_identity_batch',
     'exceptional_family',
-    'asymptotic_expansion_phi_n',
-    'asymptotic_expansion_ln_phi_n',
-    'cyclotomic_identities'
+    'exceptional_family_tuples',
+    'FamilySoA'
 ]
+
+# asymptotic.py and cyclotomic.py are not yet in the repository; export
+# their results only when they are present
+try:
+    from .asymptotic import (
+        asymptotic_expansion_phi_n,
+        asymptotic_expansion_ln_phi_n,
+        catalan_coefficients,
+        expansion_coefficients_b_k
+    )
+except ModuleNotFoundError as exc:
+    if exc.name != f'{__name__}.asymptotic':
+        raise
+else:
+    __all__ += ['asymptotic_expansion_phi_n', 'asymptotic_expansion_ln_phi_n']
+
+try:
+    from .cyclotomic import (
+        cyclotomic_identities,
+        verify_cyclotomic_identities,
+        pentagonal_geometry
+    )
+except ModuleNotFoundError as exc:
+    if exc.name != f'{__name__}.cyclotomic':
+        raise
+else:
+    __all__ += ['cyclotomic_identities']